@@ -1,9 +1,129 @@
 import sys
 import json
+import math
 import random
+import bisect
+import collections
+import numpy as np
 from PySide6 import QtWidgets, QtCore, QtGui
 import rectpack
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, run_packing falls back to rectpack without it
+    njit = None
+
+
+def _place_item(free_min_x, free_min_y, free_max_x, free_max_y, free_count, width, height):
+    """Place one item in the smallest free rectangle it fits, returning (free_count, x, y, rotated, placed)
+
+    The free rectangle arrays are updated in place and need room for one more entry.
+    """
+    if free_count == 0 or width <= 0 or height <= 0:
+        return free_count, 0, 0, False, False
+
+    # Pick the smallest free rectangle the item fits in, in either orientation
+    free_w = free_max_x[:free_count] - free_min_x[:free_count]
+    free_h = free_max_y[:free_count] - free_min_y[:free_count]
+    fits = (free_w >= width) & (free_h >= height)
+    fits_rotated = (free_w >= height) & (free_h >= width)
+    areas = np.where(fits | fits_rotated, free_w.astype(np.int64) * free_h, np.iinfo(np.int64).max)
+
+    best = np.argmin(areas)
+    if not (fits[best] or fits_rotated[best]):
+        return free_count, 0, 0, False, False
+    best_rotated = not fits[best]
+
+    w = height if best_rotated else width
+    h = width if best_rotated else height
+    x0, y0 = free_min_x[best], free_min_y[best]
+    x1, y1 = free_max_x[best], free_max_y[best]
+
+    # Drop the used free rectangle by moving the last one into its slot
+    free_count -= 1
+    free_min_x[best], free_min_y[best] = free_min_x[free_count], free_min_y[free_count]
+    free_max_x[best], free_max_y[best] = free_max_x[free_count], free_max_y[free_count]
+
+    # Split the leftover space along the shorter axis of the free rectangle (vertically when square, like rectpack)
+    if x1 - x0 < y1 - y0:
+        right_max_y, top_max_x = y0 + h, x1
+    else:
+        right_max_y, top_max_x = y1, x0 + w
+
+    if x0 + w < x1:
+        free_min_x[free_count], free_min_y[free_count] = x0 + w, y0
+        free_max_x[free_count], free_max_y[free_count] = x1, right_max_y
+        free_count += 1
+    if y0 + h < y1:
+        free_min_x[free_count], free_min_y[free_count] = x0, y0 + h
+        free_max_x[free_count], free_max_y[free_count] = top_max_x, y1
+        free_count += 1
+
+    return free_count, x0, y0, best_rotated, True
+
+
+def _guillotine_baf(container_w, container_h, widths, heights):
+    """Guillotine best-area-fit packing in the given order, with all sizes in whole millimetres
+
+    Returns (xs, ys, rotated, placed) for the items, followed by the free rectangles
+    left over (min_x, min_y, max_x, max_y, count) so more items can be placed later.
+    """
+    n = widths.shape[0]
+
+    # Free rectangles as parallel arrays; each placement uses one and adds at most two
+    free_min_x = np.empty(n + 1, np.int32)
+    free_min_y = np.empty(n + 1, np.int32)
+    free_max_x = np.empty(n + 1, np.int32)
+    free_max_y = np.empty(n + 1, np.int32)
+    free_min_x[0], free_min_y[0] = 0, 0
+    free_max_x[0], free_max_y[0] = container_w, container_h
+    free_count = 1
+
+    xs = np.zeros(n, np.int32)
+    ys = np.zeros(n, np.int32)
+    rotated = np.zeros(n, np.bool_)
+    placed = np.zeros(n, np.bool_)
+
+    for i in range(n):
+        free_count, xs[i], ys[i], rotated[i], placed[i] = _place_item(
+            free_min_x, free_min_y, free_max_x, free_max_y, free_count, widths[i], heights[i])
+
+    return xs, ys, rotated, placed, free_min_x, free_min_y, free_max_x, free_max_y, free_count
+
+
+if njit is not None:
+    _place_item = njit(cache=True)(_place_item)
+    _guillotine_baf = njit(cache=True)(_guillotine_baf)
+
+
+def _to_mm(metres):
+    """Convert metres (a float or an array) to whole millimetres for the guillotine kernel"""
+    return np.rint(np.asarray(metres, dtype=np.float64) * 1000).astype(np.int32)
+
+
+def _container_packable(container_w, container_h):
+    """Whether the container has finite, positive sides that are in range for the int32 kernel"""
+    short_side, long_side = sorted((container_w, container_h))
+    return bool(short_side > 0 and np.isfinite(long_side) and long_side * 1000 <= np.iinfo(np.int32).max)
+
+
+def _packable(container_w, container_h, widths, heights):
+    """Mask of the items with finite sizes of at least a millimetre that fit the container in some orientation
+
+    Anything else is left unpacked, which also keeps every size in range for the int32 kernel.
+    """
+    if not _container_packable(container_w, container_h):
+        return np.zeros(np.shape(widths), dtype=np.bool_)
+
+    short_side, long_side = sorted((container_w, container_h))
+    short_sides, long_sides = np.minimum(widths, heights), np.maximum(widths, heights)
+    return (np.rint(short_sides * 1000) >= 1) & (short_sides <= short_side) & (long_sides <= long_side)
+
+
+def _pack_fast(container_w, container_h, widths, heights):
+    """Pack with the guillotine kernel in the given order, see _guillotine_baf for the results"""
+    return _guillotine_baf(int(_to_mm(container_w)), int(_to_mm(container_h)), _to_mm(widths), _to_mm(heights))
+
 
 class PannableGraphicsView(QtWidgets.QGraphicsView):
     def __init__(self, *args, **kwargs):
@@ -15,6 +135,17 @@ class PannableGraphicsView(QtWidgets.QGraphicsView):
         self.setRenderHint(QtGui.QPainter.Antialiasing)
         self.setTransformationAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.SmartViewportUpdate)
+        # drawBackground fills every exposed rect, so Qt doesn't need to erase the viewport first
+        self.viewport().setAttribute(QtCore.Qt.WA_OpaquePaintEvent)
+        self.viewport().setAttribute(QtCore.Qt.WA_NoSystemBackground)
+
+        # Container grid, tick marks and tick labels, painted behind the scene (see set_axes)
+        self._axes = None
+        self._grid_pen = QtGui.QPen(QtGui.QColor(80, 80, 80), 1)  # Subtle grid lines
+        self._tick_pen = QtGui.QPen(QtCore.Qt.white, 1)
+        self._tick_font = QtGui.QFont()
+        self._tick_font.setPointSize(8)
 
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
@@ -48,8 +179,270 @@ class PannableGraphicsView(QtWidgets.QGraphicsView):
 
         self.scale(zoom_factor, zoom_factor)
 
+    def set_axes(self, width, height, x_ticks, y_ticks, scale_factor):
+        """Set the container size and tick values (in meters) for the grid drawn behind the scene"""
+        scaled_height = height * scale_factor
+        self._axes = (
+            width * scale_factor, scaled_height,
+            x_ticks, x_ticks * scale_factor,
+            y_ticks, scaled_height - y_ticks * scale_factor,  # Flip Y coordinate
+        )
+        self.viewport().update()
+
+    def clear_axes(self):
+        self._axes = None
+        self.viewport().update()
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        if self._axes is None:
+            return
+
+        scaled_width, scaled_height, x_ticks, scaled_xs, y_ticks, scaled_ys = self._axes
+
+        # Only draw ticks in the exposed area, with some margin for labels that overhang it
+        label_margin = 60
+        x_visible = (scaled_xs >= rect.left() - label_margin) & (scaled_xs <= rect.right() + label_margin)
+        y_visible = (scaled_ys >= rect.top() - label_margin) & (scaled_ys <= rect.bottom() + label_margin)
+        xs, x_values = scaled_xs[x_visible].tolist(), x_ticks[x_visible].tolist()
+        ys, y_values = scaled_ys[y_visible].tolist(), y_ticks[y_visible].tolist()
+
+        painter.save()
+
+        # Grid lines, skipping the container edges
+        grid_lines = [QtCore.QLineF(x, 0, x, scaled_height) for x in xs if 0 < x < scaled_width]
+        grid_lines += [QtCore.QLineF(0, y, scaled_width, y) for y in ys if 0 < y < scaled_height]
+        if grid_lines:
+            painter.setPen(self._grid_pen)
+            painter.drawLines(grid_lines)
+
+        # Tick marks below the X axis and left of the Y axis
+        tick_lines = [QtCore.QLineF(x, scaled_height, x, scaled_height + 10) for x in xs]
+        tick_lines += [QtCore.QLineF(-10, y, 0, y) for y in ys]
+        if tick_lines:
+            painter.setPen(self._tick_pen)
+            painter.drawLines(tick_lines)
+
+        # Tick labels
+        painter.setFont(self._tick_font)
+        for x, value in zip(xs, x_values):
+            painter.drawText(QtCore.QRectF(x - 50, scaled_height + 15, 100, 20),
+                             QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop, f"{value:.1f}")
+        for y, value in zip(ys, y_values):
+            painter.drawText(QtCore.QRectF(-115, y - 10, 100, 20),
+                             QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, f"{value:.1f}")
+
+        painter.restore()
+
+
+class LoadTableModel(QtCore.QAbstractTableModel):
+    """Load items shown in the load table, stored column by column"""
+    NAME, WIDTH, HEIGHT, COLOR = range(4)
+    HEADERS = ("Name", "W (m)", "L (m)", "Color")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Names stay a list, the numeric columns are numpy arrays that packing can use directly
+        self._names = []
+        self._widths = np.empty(0, dtype=np.float64)
+        self._heights = np.empty(0, dtype=np.float64)
+        self._colors = np.empty((0, 4), dtype=np.float64)  # (r, g, b, a) floats in 0-1
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        row, column = index.row(), index.column()
+
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            if column == self.NAME:
+                return self._names[row]
+            if column == self.WIDTH:
+                return str(float(self._widths[row]))
+            if column == self.HEIGHT:
+                return str(float(self._heights[row]))
+        elif role == QtCore.Qt.BackgroundRole:
+            if column == self.COLOR:
+                r, g, b, a = self._colors[row].tolist()
+                return QtGui.QColor(int(r * 255), int(g * 255), int(b * 255), int(a * 255))
+        elif role == QtCore.Qt.TextAlignmentRole:
+            return QtCore.Qt.AlignCenter
+
+        # Anything else falls back to the view's defaults
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def flags(self, index):
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        if index.column() != self.COLOR:  # Colours are picked with a dialog rather than typed
+            flags |= QtCore.Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if role != QtCore.Qt.EditRole:
+            return False
+
+        row, column = index.row(), index.column()
+        if column == self.NAME:
+            self._names[row] = str(value)
+        elif column in (self.WIDTH, self.HEIGHT):
+            try:
+                dimension = float(value)
+            except ValueError:
+                return False  # Keep the previous value rather than storing something unpackable
+            if not (math.isfinite(dimension) and dimension > 0):
+                return False
+            (self._widths if column == self.WIDTH else self._heights)[row] = dimension  # Arrays are updated in place
+        else:
+            return False
+
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def load(self, row):
+        """Get one load as (name, width, height, colour)"""
+        return self._names[row], float(self._widths[row]), float(self._heights[row]), tuple(self._colors[row].tolist())
+
+    def columns(self):
+        """Get every load as (names, widths, heights, colours), a list of names and numpy arrays for the rest
+
+        The arrays are the model's own storage, so copy them before changing them.
+        """
+        return self._names, self._widths, self._heights, self._colors
+
+    def append_load(self, name, width, height, color_rgba):
+        row = len(self._names)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._names.append(name)
+        self._widths = np.append(self._widths, width)
+        self._heights = np.append(self._heights, height)
+        self._colors = np.vstack((self._colors, color_rgba))
+        self.endInsertRows()
+
+    def remove_load(self, row):
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._names[row]
+        self._widths = np.delete(self._widths, row)
+        self._heights = np.delete(self._heights, row)
+        self._colors = np.delete(self._colors, row, axis=0)
+        self.endRemoveRows()
+
+    def set_loads(self, loads):
+        """Replace every load with the given (name, width, height, colour) tuples in one reset"""
+        self.beginResetModel()
+        if loads:
+            names, widths, heights, colors = zip(*loads)
+        else:
+            names, widths, heights, colors = (), (), (), ()
+        self._names = list(names)
+        self._widths = np.array(widths, dtype=np.float64)
+        self._heights = np.array(heights, dtype=np.float64)
+        self._colors = np.array(colors, dtype=np.float64).reshape(-1, 4)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_loads([])
+
+    def set_color(self, row, color_rgba):
+        self._colors[row] = color_rgba
+        color_index = self.index(row, self.COLOR)
+        self.dataChanged.emit(color_index, color_index, [QtCore.Qt.BackgroundRole])
+
+
+class ColorSwatchDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints a load's colour as a small bordered swatch in the middle of its cell"""
+    SWATCH_SIZE = QtCore.QSize(32, 18)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._border_pen = QtGui.QPen(QtCore.Qt.gray, 1)
+
+    def paint(self, painter, option, index):
+        # Let the style draw the cell background and selection, then the swatch on top
+        style = option.widget.style() if option.widget else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        color = index.data(QtCore.Qt.BackgroundRole)
+        if color is None:
+            return
+
+        swatch = QtCore.QRect(QtCore.QPoint(0, 0), self.SWATCH_SIZE)
+        swatch.moveCenter(option.rect.center())
+        painter.save()
+        painter.setPen(self._border_pen)
+        painter.setBrush(color)
+        painter.drawRect(swatch.adjusted(0, 0, -1, -1))
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return self.SWATCH_SIZE
+
+
+class LoadTableView(QtWidgets.QTableView):
+    """Table view that sizes its measured columns once per model reset or style change rather than on every layout"""
+    WIDTH_SAMPLE_STRIDE = 64  # Only every 64th row is measured when sizing columns
+    MIN_COLUMN_WIDTH = 55
+    CELL_PADDING = 12
+
+    def __init__(self, measured_columns=(), parent=None):
+        super().__init__(parent)
+        self._measured_columns = tuple(measured_columns)
+        self._column_widths = {}
+
+    def setModel(self, model):
+        super().setModel(model)
+        model.modelReset.connect(self._update_column_widths)
+        self._update_column_widths()
+
+    def changeEvent(self, event):
+        # Fonts and header padding come from the style, so measure again once it changes
+        if event.type() in (QtCore.QEvent.StyleChange, QtCore.QEvent.FontChange) and self.model() is not None:
+            self._update_column_widths()
+        super().changeEvent(event)
+
+    def sizeHintForColumn(self, column):
+        if column in self._column_widths:
+            return self._column_widths[column]
+        return super().sizeHintForColumn(column)
+
+    def _update_column_widths(self):
+        """Measure the header and a sample of rows for each measured column and apply the widths"""
+        model = self.model()
+        header = self.horizontalHeader()
+        self.ensurePolished()
+        header.ensurePolished()
+        cell_metrics = self.fontMetrics()
+
+        for column in self._measured_columns:
+            # The header reports its own size, including the stylesheet's padding and bold font
+            header_width = header.sectionSizeFromContents(column).width()
+            width = 0
+            for row in range(0, model.rowCount(), self.WIDTH_SAMPLE_STRIDE):
+                text = model.data(model.index(row, column))
+                width = max(width, cell_metrics.horizontalAdvance(str(text)))
+
+            self._column_widths[column] = max(self.MIN_COLUMN_WIDTH, header_width, width + self.CELL_PADDING)
+            self.setColumnWidth(column, self._column_widths[column])
+
 
 class PackingViewer(QtWidgets.QMainWindow):
+    PACK_CACHE_SIZE = 32  # Number of packing results kept by run_packing
+    SCALE_FACTOR = 50  # Scale 1 meter = 50 pixels
+    # Tick spacing for container dimensions up to each threshold, and above the last one
+    _TICK_THRESHOLDS = (5, 10, 20, 50)
+    _TICK_SPACINGS = (0.5, 1.0, 2.0, 5.0, 10.0)
+    _CENTER = QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter  # Alignment for table cells
+    _ITEM_PEN = QtGui.QPen(QtCore.Qt.white, 1)  # White border for items
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Container Packing Visualiser - 2D")
@@ -60,6 +453,18 @@ class PackingViewer(QtWidgets.QMainWindow):
 
         self._save_name = None
 
+        # Fonts shared by every label drawn on the canvas
+        self._axis_font = QtGui.QFont()
+        self._axis_font.setPointSize(8)
+        self._item_font = QtGui.QFont()
+        self._item_font.setPointSize(10)
+        self._item_font_small = QtGui.QFont()
+        self._item_font_small.setPointSize(8)
+        # Labels are sized from these instead of measuring each text item after it's created
+        self._axis_metrics = QtGui.QFontMetricsF(self._axis_font)
+        self._item_metrics = QtGui.QFontMetricsF(self._item_font)
+        self._item_metrics_small = QtGui.QFontMetricsF(self._item_font_small)
+
         # --- Left Sidebar Content ---
         sidebar_widget = QtWidgets.QWidget()
         sidebar_layout = QtWidgets.QVBoxLayout(sidebar_widget)
@@ -100,6 +505,8 @@ class PackingViewer(QtWidgets.QMainWindow):
         # --- Canvas (2D View) ---
         self.canvas = PannableGraphicsView()
         self.scene = QtWidgets.QGraphicsScene()
+        self.scene.setItemIndexMethod(QtWidgets.QGraphicsScene.BspTreeIndex)
+        self.scene.setBspTreeDepth(8)
         # self.scene.setSceneRect(-1000, -1000, 1000, 1000)  # Width x Height in scene coordinates
         self.canvas.setScene(self.scene)
         
@@ -119,9 +526,16 @@ class PackingViewer(QtWidgets.QMainWindow):
          
         self.setCentralWidget(central_widget)
 
-        self.load_row_colours = {}
+        self._pack_cache = collections.OrderedDict()
+        self._free_space = None  # Space left by the last packing, used to place newly added loads
+
+        # Persistent canvas groups, the axes are only rebuilt when the container size changes
+        self._axes_group = None
+        self._items_group = None
+        self._drawn_container = None
         self._initialize_default_data()
-        self.run_packing(display_msg=False)
+        # Pack once the event loop starts, so the window is shown first and the canvas fits its real size
+        QtCore.QTimer.singleShot(0, lambda: self.run_packing(display_msg=False))
 
     def _on_vertical_header_right_click(self, pos):
         header = self.load_table.verticalHeader()
@@ -135,7 +549,7 @@ class PackingViewer(QtWidgets.QMainWindow):
         action = menu.exec_(header.mapToGlobal(pos))
 
         if action == delete_action:
-            self.load_table.removeRow(row)
+            self.load_model.remove_load(row)
 
     def _create_menu_bar(self):
         self.menu_bar = self.menuBar()
@@ -189,60 +603,78 @@ class PackingViewer(QtWidgets.QMainWindow):
 
         table.setEditTriggers(QtWidgets.QAbstractItemView.AllEditTriggers)
 
-        # Set maximum height for the container table
-        header_height = table.horizontalHeader().height()
+        self._fit_container_table_height(table)
+
+        return table
+
+    def _fit_container_table_height(self, table):
+        """Limit the container table to its header and single row, which depend on the current style"""
+        header_height = table.horizontalHeader().sizeHint().height()
         row_height = table.rowHeight(0)
         calculated_height = header_height + row_height + 2
         table.setMaximumHeight(calculated_height)
 
-        return table
+    def changeEvent(self, event):
+        # A new stylesheet changes the header height the container table was sized for
+        if event.type() == QtCore.QEvent.StyleChange:
+            self._fit_container_table_height(self.container_table)
+        super().changeEvent(event)
 
     def _create_load_table(self):
         # Start with 0 rows, the first row will be added by _add_load_row_with_color
-        table = QtWidgets.QTableWidget(0, 4)  # 4 columns: Name, W, H, Color
-        table.setHorizontalHeaderLabels(["Name", "W (m)", "L (m)", "Color"])
+        self.load_model = LoadTableModel(self)  # 4 columns: Name, W, H, Color
+        table = LoadTableView(measured_columns=(LoadTableModel.WIDTH, LoadTableModel.HEIGHT))
+        table.setModel(self.load_model)
         # Show vertical header for load table
         table.verticalHeader().setVisible(True)
-        table.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        # Every row is the same height, so the view never has to size rows from their contents
+        table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(22)
+        table.setWordWrap(False)
         table.setEditTriggers(QtWidgets.QAbstractItemView.AllEditTriggers)
+        table.clicked.connect(self._on_load_table_clicked)
+        table.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self._color_delegate = ColorSwatchDelegate(table)
+        table.setItemDelegateForColumn(LoadTableModel.COLOR, self._color_delegate)
 
         # Set column resize modes and widths
         table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
         table.horizontalHeader().setSectionResizeMode(1, QtWidgets.QHeaderView.Fixed)
         table.horizontalHeader().setSectionResizeMode(2, QtWidgets.QHeaderView.Fixed)
         table.horizontalHeader().setSectionResizeMode(3, QtWidgets.QHeaderView.Fixed)
-        table.setColumnWidth(1, 55)  # W
-        table.setColumnWidth(2, 55)  # H
-        table.setColumnWidth(3, 60)  # Color
+        table.setColumnWidth(3, 60)  # Color, W and H are sized by LoadTableView
         
 
         return table
 
     def _initialize_default_data(self):
         """Add initial load row with a default random color"""
-        self._add_load_row_with_color(self.load_table, 0)
+        self._add_load_row_with_color()
 
     def _create_centered_table_item(self, text):
         item = QtWidgets.QTableWidgetItem(text)
-        item.setTextAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter)
+        item.setTextAlignment(self._CENTER)
         return item
 
     def _add_load_row(self):
-        row_count = self.load_table.rowCount()
-        self._add_load_row_with_color(self.load_table, row_count)
-
-    def _add_load_row_with_color(self, table, row_index, name=None, w=None, h=None, color_rgba=None):
-        table.insertRow(row_index)
-
-        # Fallback: copy width/height from the last existing row
-        if w is None or h is None:
-            if row_index > 0:
-                prev_w_item = table.item(row_index - 1, 1)
-                prev_h_item = table.item(row_index - 1, 2)
-                if w is None and prev_w_item and prev_w_item.text().strip().isdigit():
-                    w = int(prev_w_item.text().strip())
-                if h is None and prev_h_item and prev_h_item.text().strip().isdigit():
-                    h = int(prev_h_item.text().strip())
+        row_count = self.load_model.rowCount()
+        self._add_load_row_with_color()
+        self._place_new_load(row_count)
+
+    def _add_load_row_with_color(self, name=None, w=None, h=None, color_rgba=None):
+        row_index = self.load_model.rowCount()
+        previous = self.load_model.load(row_index - 1) if row_index > 0 else None
+        self.load_model.append_load(*self._make_load(row_index, previous, name, w, h, color_rgba))
+
+    def _make_load(self, row_index, previous=None, name=None, w=None, h=None, color_rgba=None):
+        """Fill in the defaults for a new load, returning (name, width, height, colour)"""
+        # Fallback: copy width/height from the previous load
+        if previous is not None:
+            _prev_name, prev_w, prev_h, _prev_color = previous
+            if w is None:
+                w = prev_w
+            if h is None:
+                h = prev_h
 
         # Final fallback if still None
         if w is None:
@@ -250,34 +682,20 @@ class PackingViewer(QtWidgets.QMainWindow):
         if h is None:
             h = "1.0"
 
-        # Set name
+        try:
+            width = float(w)
+            height = float(h)
+            if not all(math.isfinite(dimension) and dimension > 0 for dimension in (width, height)):
+                raise ValueError(f"dimensions must be positive numbers, got {w!r} x {h!r}")
+        except (TypeError, ValueError) as e:
+            print(f"Warning: Invalid dimension for row {row_index}. Defaulting to 1. Error: {e}")
+            width, height = 1.0, 1.0
+
+        # Set name and colour
         item_name = name if name is not None else f"Load {row_index + 1}"
-        table.setItem(row_index, 0, self._create_centered_table_item(item_name))
-
-        # Set dimensions
-        table.setItem(row_index, 1, self._create_centered_table_item(str(w)))
-        table.setItem(row_index, 2, self._create_centered_table_item(str(h)))
-
-        color_button = QtWidgets.QPushButton()
-        color_button.setFixedSize(32, 18)
-        color_button.clicked.connect(lambda checked, row=row_index: self._on_color_button_clicked(row))
-
-        # Create a QWidget wrapper with a horizontal layout
-        container_widget = QtWidgets.QWidget()
-        layout = QtWidgets.QHBoxLayout(container_widget)
-        layout.addWidget(color_button)
-        layout.setAlignment(QtCore.Qt.AlignCenter)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        table.setCellWidget(row_index, 3, container_widget)
-
-        # Set colour
         final_color_rgba = color_rgba if color_rgba is not None else self._generate_random_color()
-        self._set_button_color(color_button, final_color_rgba)
-
-        # Store colour for that row
-        self.load_row_colours[row_index] = final_color_rgba
 
+        return item_name, width, height, tuple(final_color_rgba)
 
     def _generate_random_color(self):
         # Generate distinct, not too dark/light colors
@@ -286,19 +704,12 @@ class PackingViewer(QtWidgets.QMainWindow):
         b = random.uniform(0.3, 0.9)
         return (r, g, b, 0.8)
 
-    def _set_button_color(self, button, rgba_color):
-        r, g, b, a = rgba_color
-        # Convert float (0-1) to int (0-255) for stylesheet
-        r_int, g_int, b_int, a_int = int(r * 255), int(g * 255), int(b * 255), int(a * 255)
-        button.setStyleSheet(f"background-color: rgba({r_int}, {g_int}, {b_int}, {a_int}); border: 1px solid gray;")
-        # Store the float rgba tuple as a property
-        button.setProperty("item_color", rgba_color)
-
-    def _on_color_button_clicked(self, row):
-        current_color_rgba = self.load_row_colours.get(row)
+    def _on_load_table_clicked(self, index):
+        if index.column() != LoadTableModel.COLOR:
+            return
 
-        if current_color_rgba is None:
-            return  # Or handle gracefully
+        row = index.row()
+        current_color_rgba = self.load_model.load(row)[3]
 
         current_qcolor = QtGui.QColor(
             int(current_color_rgba[0] * 255),
@@ -316,13 +727,7 @@ class PackingViewer(QtWidgets.QMainWindow):
                 new_qcolor.blue() / 255,
                 new_qcolor.alpha() / 255
             )
-            self.load_row_colours[row] = new_rgba
-
-            button_container = self.load_table.cellWidget(row, 3)
-            if button_container is not None:
-                button = button_container.findChild(QtWidgets.QPushButton)
-                if button is not None:
-                    self._set_button_color(button, new_rgba)
+            self.load_model.set_color(row, new_rgba)
 
     def new_file(self):
         # Clear container table
@@ -333,12 +738,11 @@ class PackingViewer(QtWidgets.QMainWindow):
         self.container_table.setItem(0, 2, self._create_centered_table_item("10"))
 
         # Clear load table
-        self.load_table.clearContents()
-        self.load_table.setRowCount(0)
-        self._add_load_row_with_color(self.load_table, 0)
+        self.load_model.clear()
+        self._add_load_row_with_color()
 
         # Clear canvas
-        self.scene.clear()
+        self._clear_canvas()
 
     def save_file(self):
         file_name = self._save_name
@@ -367,15 +771,13 @@ class PackingViewer(QtWidgets.QMainWindow):
             
 
             # Get loads data
-            for row in range(self.load_table.rowCount()):
+            names, widths, heights, colors = self.load_model.columns()
+            for name, width, height, color in zip(names, widths.tolist(), heights.tolist(), colors.tolist()):
                 load_data = {}
-                load_data["name"] = self.load_table.item(row, 0).text() if self.load_table.item(row, 0) else ""
-                load_data["width"] = self.load_table.item(row, 1).text() if self.load_table.item(row, 1) else "1"
-                load_data["height"] = self.load_table.item(row, 2).text() if self.load_table.item(row, 2) else "1"
-                button_container = self.load_table.cellWidget(row, 3)
-                if button_container is not None:
-                    color_button = button_container.findChild(QtWidgets.QPushButton)
-                load_data["color"] = color_button.property("item_color") if color_button else (0.5, 0.5, 0.5, 0.8)
+                load_data["name"] = name
+                load_data["width"] = str(width)
+                load_data["height"] = str(height)
+                load_data["color"] = color
                 data["loads"].append(load_data)
 
             try:
@@ -400,20 +802,19 @@ class PackingViewer(QtWidgets.QMainWindow):
                 self.container_table.setItem(0, 1, self._create_centered_table_item(container_data.get("width", "10")))
                 self.container_table.setItem(0, 2, self._create_centered_table_item(container_data.get("height", "10")))
 
-                # Load loads data
-                self.load_table.clearContents()
-                self.load_table.setRowCount(0)
-                loads_data = data.get("loads", [])
-                for i, load in enumerate(loads_data):
-                    self._add_load_row_with_color(
-                        self.load_table, i,
+                # Load loads data, building every row first so the table is reset only once
+                loads = []
+                for load in data.get("loads", []):
+                    loads.append(self._make_load(
+                        len(loads), loads[-1] if loads else None,
                         name=load.get("name"),
                         w=load.get("width"),
                         h=load.get("height"),
                         color_rgba=load.get("color")
-                    )
-                if not loads_data:
-                    self._add_load_row_with_color(self.load_table, 0)
+                    ))
+                if not loads:
+                    loads.append(self._make_load(0))
+                self.load_model.set_loads(loads)
 
                 self._save_name = file_name
                 self.run_packing(display_msg=False)
@@ -424,82 +825,176 @@ class PackingViewer(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.warning(self, "Load Error", f"Invalid JSON format: Missing key {e}")
 
     def run_packing(self, *args, display_msg=True):
-        """Run the 2D packing simulation using rectpack"""
-        self.scene.clear()
-
+        """Run the 2D packing simulation"""
         # Get container dimensions
         container_data = self._get_container()
         container_width = container_data['width']
         container_height = container_data['height']
 
         # Get items to pack
-        items_to_pack = self._get_items_for_packing()
+        widths, heights, names, colors = self._get_items_for_packing()
 
-        if not items_to_pack and display_msg:
+        if not names and display_msg:
+            self._clear_canvas()
             QtWidgets.QMessageBox.warning(self, "No Items", "No items to pack!")
             return
 
-        # Create a packer
-        packer = rectpack.newPacker()
+        # Pack the rectangles, reusing a previous result if the inputs are unchanged
+        placements, free_space = self._pack(container_width, container_height, widths, heights)
 
-        # Add the bin (container)
-        packer.add_bin(container_width, container_height)
-
-        # Add rectangles to pack
-        packed_items = []
-        unpacked_items = []
-
-        for i, (item_data, color) in enumerate(items_to_pack):
-            width, height, name = item_data
-            packer.add_rect(width, height, rid=i)
-            packed_items.append((item_data, color))
-
-        # Pack the rectangles
-        packer.pack()
+        # Keep a copy of the leftover space so loads added afterwards can be placed without repacking
+        self._free_space = None
+        if free_space is not None:
+            *free_rects, free_count = free_space
+            self._free_space = ((container_width, container_height), [rects.copy() for rects in free_rects], free_count)
 
         # Draw the container
         self._draw_container(container_width, container_height)
 
-        # Get packing results
-        packed_rects = []
-        unpacked_rects = []
-        packed_ids = []
-
-        try:
-            for rect in packer[0]:  # First (and only) bin
-                rid = rect.rid
-                item_data, color = packed_items[rid]
-                packed_rects.append((rect, item_data, color))
-                packed_ids.append(rect.rid)
-        except IndexError as e:
-            pass
-            
-        for i, (item_data, color) in enumerate(packed_items):
-            if i not in packed_ids:
-                unpacked_rects.append((item_data, color))
-
-        # Draw packed rectangles
-        for rect, item_data, color in packed_rects:
-            self._draw_item(rect.x, rect.y, rect.width, rect.height, item_data[2], color)
+        # Draw packed rectangles, scaling geometry and colours in one pass up front
+        self._items_group = self._replace_group(self._items_group)
+        self._items_group.setZValue(1)  # Keep items above the grid
+        if placements:
+            placements_array = np.array(placements, dtype=np.float64)
+            # Round the corners rather than position and size separately, so neighbouring items stay flush
+            corners = placements_array[:, :4].copy()
+            corners[:, 2:] += corners[:, :2]
+            corners = self._to_pixels(corners)
+            scaled = np.hstack((corners[:, :2], corners[:, 2:] - corners[:, :2]))
+            rids = placements_array[:, 4].astype(np.intp)
+            colors8 = (np.array(colors, dtype=np.float64)[rids] * 255).astype(np.uint8)
+
+            for (scaled_x, scaled_y, scaled_width, scaled_height), (r, g, b, a), rid in zip(
+                    scaled.tolist(), colors8.tolist(), rids.tolist()):
+                self._draw_item(scaled_x, scaled_y, scaled_width, scaled_height, names[rid], QtGui.QColor(r, g, b, a))
             
         self._zoom_to_fit()
 
         # Show results
-        if unpacked_rects and display_msg:
-            unpacked_names = [item[0][2] for item in unpacked_rects]
-            msg = QtWidgets.QMessageBox()
+        packed_ids = {rid for _x, _y, _width, _height, rid in placements}
+        unpacked_names = [name for rid, name in enumerate(names) if rid not in packed_ids]
+        if unpacked_names and display_msg:
+            msg = QtWidgets.QMessageBox(self)
             msg.setIcon(QtWidgets.QMessageBox.Warning)
             msg.setText("Some loads could not be fitted into the container:")
             msg.setInformativeText("\n".join(unpacked_names))
             msg.setWindowTitle("Packing Result")
             msg.exec()
         elif display_msg:
-            msg = QtWidgets.QMessageBox()
+            msg = QtWidgets.QMessageBox(self)
             msg.setIcon(QtWidgets.QMessageBox.Information)
             msg.setText("All loads fitted successfully!")
             msg.setWindowTitle("Packing Result")
             msg.exec()
 
+    def _pack(self, container_width, container_height, widths, heights):
+        """Pack items into the container, returning (x, y, width, height, rid) tuples and the free space"""
+        # Names and colours don't affect the layout, so only dimensions go in the key
+        key = (container_width, container_height, widths.tobytes(), heights.tobytes())
+
+        cached = self._pack_cache.get(key)
+        if cached is not None:
+            self._pack_cache.move_to_end(key)
+            return cached
+
+        # Pack largest items first (by area, then longer side); rids stay as table rows
+        order = np.lexsort((-np.maximum(widths, heights), -(widths * heights)))
+        order = order[_packable(container_width, container_height, widths, heights)[order]]
+        sorted_widths, sorted_heights = widths[order], heights[order]
+
+        if not _container_packable(container_width, container_height):
+            placements, free_space = [], None
+        elif njit is not None:
+            xs, ys, rotated, placed, *free_space = _pack_fast(
+                container_width, container_height, sorted_widths, sorted_heights)
+
+            # Report the sizes the kernel packed, in whole millimetres like the positions
+            placements = []
+            for rid, x, y, width, height, is_rotated, is_placed in zip(
+                    order.tolist(), (xs / 1000).tolist(), (ys / 1000).tolist(), (_to_mm(sorted_widths) / 1000).tolist(),
+                    (_to_mm(sorted_heights) / 1000).tolist(), rotated.tolist(), placed.tolist()):
+                if is_placed:
+                    if is_rotated:
+                        width, height = height, width
+                    placements.append((x, y, width, height, rid))
+        else:
+            placements = self._pack_rectpack(container_width, container_height, sorted_widths, sorted_heights, order)
+            free_space = None  # rectpack doesn't expose its free rectangles
+
+        if widths.size:
+            self._pack_cache[key] = (placements, free_space)
+            if len(self._pack_cache) > self.PACK_CACHE_SIZE:
+                self._pack_cache.popitem(last=False)
+
+        return placements, free_space
+
+    def _pack_rectpack(self, container_width, container_height, widths, heights, rids):
+        """Pack items with rectpack in the given order, used when numba isn't installed"""
+        # Create a packer with the same heuristic as the numba kernel, the items are already sorted
+        packer = rectpack.newPacker(pack_algo=rectpack.GuillotineBafSas, sort_algo=rectpack.SORT_NONE)
+
+        # Add the bin (container), in whole millimetres and without merging free space like the kernel
+        packer.add_bin(int(_to_mm(container_width)), int(_to_mm(container_height)), merge=False)
+
+        # Add rectangles to pack
+        for rid, width, height in zip(rids.tolist(), _to_mm(widths).tolist(), _to_mm(heights).tolist()):
+            packer.add_rect(width, height, rid=rid)
+
+        packer.pack()
+
+        placements = []
+        try:
+            for rect in packer[0]:  # First (and only) bin
+                placements.append((rect.x / 1000, rect.y / 1000, rect.width / 1000, rect.height / 1000, rect.rid))
+        except IndexError:
+            pass
+
+        return placements
+
+    def _place_new_load(self, row):
+        """Place a newly added load in the space left by the last packing, drawing only that item"""
+        if self._free_space is None:
+            return
+
+        container_size, free_rects, free_count = self._free_space
+        container_data = self._get_container()
+        if (container_data['width'], container_data['height']) != container_size:
+            self._free_space = None  # The container changed, wait for a full run
+            return
+
+        name, width, height, color_rgba = self.load_model.load(row)
+        if not _packable(*container_size, width, height):
+            return
+
+        # A placement adds at most one free rectangle overall, grow the arrays geometrically if full
+        if free_count >= len(free_rects[0]):
+            free_rects = [np.concatenate((rects, np.empty_like(rects))) for rects in free_rects]
+
+        width_mm, height_mm = int(_to_mm(width)), int(_to_mm(height))
+        free_count, x, y, rotated, placed = _place_item(*free_rects, free_count, width_mm, height_mm)
+        self._free_space = (container_size, free_rects, free_count)
+        if not placed:
+            return
+
+        x, y, width, height = x / 1000, y / 1000, width_mm / 1000, height_mm / 1000
+        if rotated:
+            width, height = height, width
+        name = name if name.strip() else f"Load {row + 1}"
+        r, g, b, a = (int(channel * 255) for channel in color_rgba)
+        scaled_x, scaled_y, scaled_x1, scaled_y1 = self._to_pixels([x, y, x + width, y + height]).tolist()
+        self._draw_item(
+            scaled_x, scaled_y, scaled_x1 - scaled_x, scaled_y1 - scaled_y,
+            name, QtGui.QColor(r, g, b, a),
+        )
+
+    def _to_pixels(self, metres):
+        """Convert scene coordinates in metres to whole pixels
+
+        Going through whole millimetres first, the packer's own grid, means edges that meet
+        always round to the same pixel, whatever float error their sums picked up.
+        """
+        return np.rint(_to_mm(metres) * (self.SCALE_FACTOR / 1000)).astype(np.int32)
+
     def _get_container(self):
         """Get container dimensions from the table"""
         row = 0
@@ -514,6 +1009,8 @@ class PackingViewer(QtWidgets.QMainWindow):
         try:
             width = float(w_text)
             height = float(h_text)
+            if not _container_packable(width, height):
+                raise ValueError(f"dimensions must be positive numbers in range, got {w_text!r} x {h_text!r}")
         except ValueError as e:
             print(f"Warning: Invalid container dimension. Defaulting to 10. Error: {e}")
             width, height = 10.0, 10.0
@@ -521,37 +1018,24 @@ class PackingViewer(QtWidgets.QMainWindow):
         return {'name': name, 'width': width, 'height': height}
 
     def _get_items_for_packing(self):
-        """Get items to pack from the load table"""
-        items_with_colors = []
-        for row in range(self.load_table.rowCount()):
-            name_item = self.load_table.item(row, 0)
-            w_item = self.load_table.item(row, 1)
-            h_item = self.load_table.item(row, 2)
-
-            # Safely get text, default to "1" if item is None or text is empty
-            w_text = w_item.text() if w_item and w_item.text().strip() else "1"
-            h_text = h_item.text() if h_item and h_item.text().strip() else "1"
-
-            try:
-                width = float(w_text)
-                height = float(h_text)
-            except ValueError as e:
-                print(f"Warning: Invalid dimension for row {row}. Defaulting to 1. Error: {e}")
-                width, height = 1.0, 1.0
+        """Get items to pack from the load table as (widths, heights, names, colours)"""
+        names, widths, heights, colors = self.load_model.columns()
 
-            item_color = self.load_row_colours.get(row, (0.5, 0.5, 0.5, 0.8))
+        names = [name if name.strip() else f"Load {row + 1}" for row, name in enumerate(names)]
 
-            name = name_item.text() if name_item and name_item.text().strip() else f"Load {row + 1}"
-            
-            # Store as (width, height, name) tuple with color
-            items_with_colors.append(((width, height, name), item_color))
-        
-        return items_with_colors
+        # Copy so later edits to the table can't change a packing in progress or cached
+        return widths.copy(), heights.copy(), names, colors.copy()
 
     def _draw_container(self, width, height):
         """Draw the container outline with axis labels and grid"""
         # Scale up the drawing by a factor to make it more visible
-        scale_factor = 50  # Scale 1 meter = 50 pixels
+        # The container and axes only depend on its size, so keep them if that hasn't changed
+        if (width, height) == self._drawn_container:
+            return
+        self._axes_group = self._replace_group(self._axes_group)
+        self._drawn_container = None  # Only marked as drawn once everything below is in place
+
+        scale_factor = self.SCALE_FACTOR
         scaled_width = width * scale_factor
         scaled_height = height * scale_factor
         
@@ -559,17 +1043,20 @@ class PackingViewer(QtWidgets.QMainWindow):
         brush = QtGui.QBrush(QtCore.Qt.transparent)
         
         # Draw container rectangle
-        rect = self.scene.addRect(0, 0, scaled_width, scaled_height, pen, brush)
+        rect = QtWidgets.QGraphicsRectItem(0, 0, scaled_width, scaled_height, self._axes_group)
+        rect.setPen(pen)
+        rect.setBrush(brush)
         
         # Add container label in white
         font = QtGui.QFont()
         font.setPointSize(14)
-        text = self.scene.addText(f"Container ({width} × {height}m)", font)
-        text.setDefaultTextColor(QtCore.Qt.white)
-        text.setPos(scaled_width/2 - text.boundingRect().width()/2, -50)
+        label = f"Container ({width} × {height}m)"
+        text = self._add_text(label, font, self._axes_group)
+        text.setPos(scaled_width/2 - QtGui.QFontMetricsF(font).horizontalAdvance(label)/2, -50)
         
         # Draw axis labels and tick marks
         self._draw_axes(width, height, scale_factor)
+        self._drawn_container = (width, height)
     
     def _draw_axes(self, width, height, scale_factor):
         """Draw axis labels, tick marks, and grid lines"""
@@ -578,126 +1065,98 @@ class PackingViewer(QtWidgets.QMainWindow):
         
         # Axis styling
         axis_pen = QtGui.QPen(QtCore.Qt.white, 2)
-        tick_pen = QtGui.QPen(QtCore.Qt.white, 1)
-        grid_pen = QtGui.QPen(QtGui.QColor(80, 80, 80), 1)  # Subtle grid lines
         
-        font = QtGui.QFont()
-        font.setPointSize(8)
+        font = self._axis_font
         
         # Determine tick spacing (aim for reasonable number of ticks)
         x_tick_spacing = self._calculate_tick_spacing(width)
         y_tick_spacing = self._calculate_tick_spacing(height)
         
+        # The grid, ticks and tick labels are painted by the view, only where visible
+        self.canvas.set_axes(
+            width, height,
+            np.arange(0, width + 1e-9, x_tick_spacing),
+            np.arange(0, height + 1e-9, y_tick_spacing),
+            scale_factor,
+        )
+
         # Draw X-axis (bottom)
-        x_axis = self.scene.addLine(0, scaled_height, scaled_width, scaled_height, axis_pen)
-        
-        # X-axis ticks and labels
-        x = 0
-        while x <= width:
-            scaled_x = x * scale_factor
-            
-            # Tick mark
-            tick_line = self.scene.addLine(scaled_x, scaled_height, scaled_x, scaled_height + 10, tick_pen)
-            
-            # Grid line (vertical)
-            if x > 0 and x < width:
-                grid_line = self.scene.addLine(scaled_x, 0, scaled_x, scaled_height, grid_pen)
-            
-            # Label
-            label = self.scene.addText(f"{x:.1f}", font)
-            label.setDefaultTextColor(QtCore.Qt.white)
-            label_rect = label.boundingRect()
-            label.setPos(scaled_x - label_rect.width()/2, scaled_height + 15)
-            
-            x += x_tick_spacing
+        x_axis = QtWidgets.QGraphicsLineItem(0, scaled_height, scaled_width, scaled_height, self._axes_group)
+        x_axis.setPen(axis_pen)
         
         # Draw Y-axis (left)
-        y_axis = self.scene.addLine(0, 0, 0, scaled_height, axis_pen)
-        
-        # Y-axis ticks and labels
-        y = 0
-        while y <= height:
-            scaled_y = scaled_height - (y * scale_factor)  # Flip Y coordinate
-            
-            # Tick mark
-            tick_line = self.scene.addLine(-10, scaled_y, 0, scaled_y, tick_pen)
-            
-            # Grid line (horizontal)
-            if y > 0 and y < height:
-                grid_line = self.scene.addLine(0, scaled_y, scaled_width, scaled_y, grid_pen)
-            
-            # Label
-            label = self.scene.addText(f"{y:.1f}", font)
-            label.setDefaultTextColor(QtCore.Qt.white)
-            label_rect = label.boundingRect()
-            label.setPos(-label_rect.width() - 15, scaled_y - label_rect.height()/2)
-            
-            y += y_tick_spacing
+        y_axis = QtWidgets.QGraphicsLineItem(0, 0, 0, scaled_height, self._axes_group)
+        y_axis.setPen(axis_pen)
         
         # Add axis titles
         # X-axis title
-        x_title = self.scene.addText("Width (m)", font)
-        x_title.setDefaultTextColor(QtCore.Qt.white)
-        x_title_rect = x_title.boundingRect()
-        x_title.setPos(scaled_width/2 - x_title_rect.width()/2, scaled_height + 50)
+        x_title = self._add_text("Width (m)", font, self._axes_group)
+        x_title.setPos(scaled_width/2 - self._axis_metrics.horizontalAdvance("Width (m)")/2, scaled_height + 50)
         
         # Y-axis title (rotated)
-        y_title = self.scene.addText("Length (m)", font)
-        y_title.setDefaultTextColor(QtCore.Qt.white)
+        y_title = self._add_text("Length (m)", font, self._axes_group)
         y_title.setRotation(-90)
-        y_title_rect = y_title.boundingRect()
-        y_title.setPos(-90, scaled_height/2 + y_title_rect.width()/2)
+        y_title.setPos(-90, scaled_height/2 + self._axis_metrics.horizontalAdvance("Length (m)")/2)
     
     def _calculate_tick_spacing(self, dimension):
         """Calculate appropriate tick spacing based on dimension"""
-        if dimension <= 5:
-            return 0.5
-        elif dimension <= 10:
-            return 1.0
-        elif dimension <= 20:
-            return 2.0
-        elif dimension <= 50:
-            return 5.0
-        else:
-            return 10.0
-
-    def _draw_item(self, x, y, width, height, name, color_rgba):
-        """Draw a packed item rectangle"""
-        # Scale up the drawing by the same factor
-        scale_factor = 50  # Scale 1 meter = 50 pixels
-        scaled_x = x * scale_factor
-        scaled_y = y * scale_factor
-        scaled_width = width * scale_factor
-        scaled_height = height * scale_factor
+        # bisect_left keeps each threshold inclusive, e.g. a 5m container still gets 0.5m ticks
+        return self._TICK_SPACINGS[bisect.bisect_left(self._TICK_THRESHOLDS, dimension)]
+
+    def _draw_item(self, scaled_x, scaled_y, scaled_width, scaled_height, name, qcolor):
+        """Draw a packed item rectangle, given in scene pixels"""
+        brush = QtGui.QBrush(qcolor)
         
-        r, g, b, a = color_rgba
+        # Draw rectangle, borders use the shared white pen
+        rect = QtWidgets.QGraphicsRectItem(scaled_x, scaled_y, scaled_width, scaled_height, self._items_group)
+        rect.setPen(self._ITEM_PEN)
+        rect.setBrush(brush)
+        # Pan and zoom repaint from a cached pixmap instead of re-rasterising every item
+        rect.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
         
-        # Create color and pen with white borders
-        qcolor = QtGui.QColor(int(r*255), int(g*255), int(b*255), int(a*255))
-        pen = QtGui.QPen(QtCore.Qt.white, 1)  # White border for items
-        brush = QtGui.QBrush(qcolor)
+        # Only label rectangles big enough for the text to be readable at scale
+        min_text_size = 20
+        if scaled_width <= min_text_size or scaled_height <= min_text_size/2:
+            return
+
+        font, metrics = self._item_font, self._item_metrics
+        text_width, text_height = metrics.horizontalAdvance(name), metrics.height()
         
-        # Draw rectangle
-        rect = self.scene.addRect(scaled_x, scaled_y, scaled_width, scaled_height, pen, brush)
+        # Make text smaller if it still doesn't fit
+        if text_width > scaled_width * 0.9 or text_height > scaled_height * 0.8:
+            font, metrics = self._item_font_small, self._item_metrics_small
+            text_width, text_height = metrics.horizontalAdvance(name), metrics.height()
         
-        # Add item label if rectangle is large enough
-        min_text_size = 20  # Minimum size for text to be readable at scale
-        if scaled_width > min_text_size and scaled_height > min_text_size/2:
-            font = QtGui.QFont()
-            font.setPointSize(10)
-            text = self.scene.addText(name, font)
-            text.setDefaultTextColor(QtCore.Qt.white)  # White text
-            
-            # Center the text in the rectangle
-            text_rect = text.boundingRect()
-            text_x = scaled_x + scaled_width/2 - text_rect.width()/2
-            text_y = scaled_y + scaled_height/2 - text_rect.height()/2
-            text.setPos(text_x, text_y)
-            
-            # Make text smaller if it still doesn't fit
-            if text_rect.width() > scaled_width * 0.9 or text_rect.height() > scaled_height * 0.8:
-                font.setPointSize(8)
-                text.setFont(font)
+        # Center the text in the rectangle
+        text = self._add_text(name, font, self._items_group)
+        text_x = scaled_x + scaled_width/2 - text_width/2
+        text_y = scaled_y + scaled_height/2 - text_height/2
+        text.setPos(text_x, text_y)
+
+    def _add_text(self, text, font, group):
+        """Add a white text label to one of the canvas groups"""
+        # Simple text items skip the QTextDocument a QGraphicsTextItem carries around
+        label = QtWidgets.QGraphicsSimpleTextItem(text, group)
+        label.setFont(font)
+        label.setBrush(QtCore.Qt.white)
+        return label
+
+    def _replace_group(self, group):
+        """Remove a group and its children from the scene, returning a new empty group"""
+        if group is not None:
+            self.scene.removeItem(group)
+        new_group = QtWidgets.QGraphicsItemGroup()
+        self.scene.addItem(new_group)
+        return new_group
+
+    def _clear_canvas(self):
+        """Remove everything from the canvas"""
+        self.scene.clear()
+        self.canvas.clear_axes()
+        self._free_space = None
+        self._axes_group = None
+        self._items_group = None
+        self._drawn_container = None
 
     def _zoom_to_fit(self):
         """Zoom the view to fit all content"""
@@ -712,120 +1171,24 @@ class PackingViewer(QtWidgets.QMainWindow):
 if __name__ == "__main__":
     import os
 
+    # Merge queued mouse move, wheel and tablet events so a fast pan or scroll triggers fewer repaints
+    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_CompressHighFrequencyEvents, True)
+    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_CompressTabletEvents, True)
+    # Don't turn sibling widgets native when one widget needs a native window
+    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_DontCreateNativeWidgetSiblings, True)
     app = QtWidgets.QApplication(sys.argv)
-    stylesheet = """
-        QMainWindow {
-    background-color: #fdfdfd;
-    }
-
-    QMenuBar {
-        background-color: #fafafa;
-        color: #333;
-        font-weight: bold;
-        spacing: 8px;
-        border-bottom: 1px solid #dcdcdc;
-    }
-
-    QMenuBar::item {
-        background: transparent;
-        padding: 6px 12px;
-    }
-
-    QMenuBar::item:selected {
-        background: #e6f9ec;
-        color: #00B140;
-        border-radius: 4px;
-    }
-
-    QMenu {
-        background-color: #ffffff;
-        color: #333;
-        border: 1px solid #ccc;
-    }
-
-    QMenu::item {
-        padding: 6px 24px;
-    }
-
-    QMenu::item:selected {
-        background-color: #d8f5e1;
-        color: #00B140;
-    }
-
-        QPushButton {
-            background-color: #00B140;
-            color: white;
-            border-radius: 6px;
-            padding: 6px 12px;
-            font-weight: bold;
-        }
-
-        QPushButton:hover {
-            background-color: #009a37;
-        }
-
-        QPushButton:pressed {
-            background-color: #007a2d;
-        }
-
-        QLabel {
-            color: #222;
-            font-size: 14px;
-        }
-
-        QTableWidget {
-            background-color: white;
-            gridline-color: #ddd;
-            border: 1px solid #ccc;
-            selection-background-color: #d8f5e1;
-            selection-color: #000;
-            font-size: 13px;
-        }
-
-        QHeaderView::section {
-            background-color: #f4f4f4;
-            padding: 6px;
-            border: 1px solid #ccc;
-            font-weight: bold;
-            color: #333;
-        }
-
-        QHeaderView::section {
-            text-transform: none;
-        }
-
-        QTableWidget QTableCornerButton::section {
-            background: #f4f4f4;
-            border: 1px solid #ccc;
-        }
-
-        QScrollBar:vertical, QScrollBar:horizontal {
-            background: #f0f0f0;
-            width: 12px;
-            height: 12px;
-            margin: 0px;
-        }
-
-        QScrollBar::handle {
-            background: #c4e8cf;
-            border-radius: 6px;
-        }
-
-        QScrollBar::handle:hover {
-            background: #a8ddb9;
-        }
-
-        QScrollBar::add-line,
-        QScrollBar::sub-line {
-            background: none;
-            border: none;
-            width: 0px;
-            height: 0px;
-        }
-        """
-
-
-    app.setStyleSheet(stylesheet)
+    # Prefer the compiled stylesheet resource (see README), falling back to the file next to this script
+    try:
+        import style_rc  # Registers ":/style.qss" on import
+        style_path = ":/style.qss"
+    except ImportError:
+        style_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "style.qss")
+
+    # The stylesheet goes on the finished window, so its widgets are polished once rather than as each is created
     viewer = PackingViewer()
+    style_file = QtCore.QFile(style_path)
+    if style_file.open(QtCore.QIODevice.ReadOnly | QtCore.QIODevice.Text):
+        viewer.setStyleSheet(QtCore.QTextStream(style_file).readAll())
+        style_file.close()
     viewer.show()
     sys.exit(app.exec())
\ No newline at end of file